@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import html
+import json
+import os
+import re
+import sys
+import unittest
+import xml.etree.ElementTree as etree
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+from test.helper import FakeYDL
+from yt_dlp.extractor.adobepass import (
+    AdobePassIE,
+    MSOInfo,
+    _spectrum_saml_vars,
+    _unescape_xml,
+    _xml_fields,
+    get_mso,
+    mso_ids,
+    mso_list,
+)
+from yt_dlp.utils import ExtractorError, unescapeHTML
+
+
+class TestAdobePassMSO(unittest.TestCase):
+    def test_get_mso(self):
+        self.assertEqual(get_mso('DTV'), MSOInfo('DIRECTV', 'username', 'password'))
+        self.assertEqual(get_mso('Comcast_SSO'), MSOInfo(
+            'Comcast XFINITY', 'user', 'passwd', 'login.xfinity.com'))
+        self.assertEqual(get_mso('Philo'), MSOInfo('Philo', 'ident'))
+        self.assertEqual(get_mso('Spectrum'), MSOInfo('Spectrum', 'IDToken1', 'IDToken2'))
+        # Last entry of the data
+        self.assertEqual(get_mso('AlticeOne'), MSOInfo('Optimum TV', 'j_username', 'j_password'))
+
+    def test_get_mso_invalid(self):
+        self.assertIsNone(get_mso(''))
+        self.assertIsNone(get_mso('Bogus'))
+        self.assertIsNone(get_mso('DTV;DIRECTV'))
+        self.assertIsNone(get_mso('DTV\nATT'))
+        # Prefix of an existing id
+        self.assertIsNone(get_mso('Comcast'))
+
+    def test_mso_ids(self):
+        self.assertEqual(len(mso_ids()), len(set(mso_ids())))
+        for mso_id in mso_ids():
+            mso_info = get_mso(mso_id)
+            self.assertIsInstance(mso_info, MSOInfo, mso_id)
+            self.assertTrue(mso_info.name, mso_id)
+
+    def test_mso_list(self):
+        names = [name.lower() for _, name in mso_list()]
+        self.assertEqual(names, sorted(names))
+        self.assertEqual({mso_id for mso_id, _ in mso_list()}, set(mso_ids()))
+        self.assertIn(('DTV', 'DIRECTV'), mso_list())
+
+
+def _etree_mvpd_resource(provider_id, title, guid, rating):
+    # Reference implementation that the resource used to be built with
+    channel = etree.Element('channel')
+    etree.SubElement(channel, 'title').text = provider_id
+    item = etree.SubElement(channel, 'item')
+    etree.SubElement(item, 'title').text = title
+    etree.SubElement(item, 'guid').text = guid
+    resource_rating = etree.SubElement(item, 'media:rating')
+    resource_rating.attrib = {'scheme': 'urn:v-chip'}
+    resource_rating.text = rating
+    return '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">' + etree.tostring(channel).decode() + '</rss>'
+
+
+class TestAdobePassResource(unittest.TestCase):
+    def test_get_mvpd_resource(self):
+        for args in (
+            ('cbs', 'Some Title', '123abc', 'TV-14'),
+            ('cbs', 'Some Title', '123abc', None),
+            ('cbs', 'Some Title', '123abc', ''),
+            ('cbs', '', '', ''),
+            ('cbs', None, None, None),
+            ('A&E', 'Tom & Jerry <Live>', 'a>b&c', 'TV-PG'),
+            ('nbc', 'Pokémon — “Ash’s” Day', 'ü-ß', 'TV-Y7'),
+            ('nbc', 'Emoji 🎬 & <tags>', '\'"quotes"\'', 'TV-MA'),
+        ):
+            with self.subTest(args=args):
+                self.assertEqual(AdobePassIE._get_mvpd_resource(*args), _etree_mvpd_resource(*args))
+
+    def test_get_mvpd_resource_guid(self):
+        self.assertEqual(AdobePassIE._get_mvpd_resource('cbs', 'Title', 'a&b', 'TV-14').guid, 'a&amp;b')
+        self.assertIsNone(AdobePassIE._get_mvpd_resource('cbs', 'Title', None, 'TV-14').guid)
+
+
+class TestAdobePassXML(unittest.TestCase):
+    def test_unescape_xml(self):
+        for s in (
+            '', 'plain text',
+            '&lt;simpleToken&gt;a &amp; b&lt;/simpleToken&gt;',
+            '&quot;&apos;&#39;',
+            '&#60;&#x3C;&#233;',
+            'a&nbsp;b',
+            'a & b',
+            '&amp;lt;', '&amp;amp;',
+            '&AMP;', '&lt;&unknown;',
+        ):
+            with self.subTest(s=s):
+                self.assertEqual(_unescape_xml(s), unescapeHTML(s))
+
+    def test_xml_fields(self):
+        # Decoded authn token with a nested element and repeated tags
+        token = (
+            '<signatureInfo>c2lnbmF0dXJl</signatureInfo>'
+            '<simpleAuthenticationToken>'
+            '<simpleTokenAuthenticationGuid>3f9c2a1e-guid</simpleTokenAuthenticationGuid>'
+            '<simpleTokenRequestorID>REQ</simpleTokenRequestorID>'
+            '<simpleTokenDomainName>adobe.com</simpleTokenDomainName>'
+            '<simpleTokenExpires>2099/01/01 00:00:00 GMT</simpleTokenExpires>'
+            '<simpleTokenMsoID>DTV</simpleTokenMsoID>'
+            '<simpleTokenSubject>subject</simpleTokenSubject>'
+            '<simpleSamlNameID>name-id</simpleSamlNameID>'
+            '<simpleSamlSessionIndex>session-index</simpleSamlSessionIndex>'
+            '<simpleTokenFingerprint/>'
+            '<userMeta><simpleTokenMsoID>nested</simpleTokenMsoID><zip>00000</zip></userMeta>'
+            '<zip>11111</zip>'
+            '<item><guid>g</guid></item><item>text</item>'
+            '<empty></empty><empty>later</empty>'
+            '<multiline>a\nb</multiline><multiline>c</multiline>'
+            '</simpleAuthenticationToken>')
+        fields = _xml_fields(token)
+        self.assertEqual(fields['simpleTokenMsoID'], 'DTV')
+        self.assertEqual(fields['zip'], '00000')
+        for tag in set(re.findall(r'<(\w+)>', token)):
+            with self.subTest(tag=tag):
+                mobj = re.search(f'<{tag}>(.+?)</{tag}>', token)
+                # Tags left out are looked up with the regex instead
+                if tag in fields:
+                    self.assertEqual(fields[tag], mobj.group(1))
+        self.assertNotIn('userMeta', fields)
+
+
+class TestAdobePassSpectrum(unittest.TestCase):
+    def test_spectrum_saml_vars(self):
+        self.assertEqual(_spectrum_saml_vars(
+            'RelayState = "rs";\nSAMLRequest="sr";\nRelayState = "other";'),
+            {'RelayState': 'rs', 'SAMLRequest': 'sr'})
+        # JS-escaped quotes are part of the value
+        self.assertEqual(_spectrum_saml_vars(
+            r'RelayState = "a\"b";SAMLRequest = "c\\";'),
+            {'RelayState': r'a\"b', 'SAMLRequest': r'c\\'})
+        # An unescaped quote ends the value, so it cannot swallow the next variable
+        self.assertEqual(_spectrum_saml_vars(
+            'RelayState = "a" + b;\nSAMLRequest = "sr";'), {'SAMLRequest': 'sr'})
+        self.assertEqual(_spectrum_saml_vars('RelayState = "";'), {})
+
+
+def _authn_token(expires):
+    return (
+        f'<simpleAuthenticationToken><simpleTokenExpires>{expires}</simpleTokenExpires>'
+        '<simpleTokenMsoID>DTV</simpleTokenMsoID><simpleSamlNameID>name-id</simpleSamlNameID>'
+        '<simpleSamlSessionIndex>session-index</simpleSamlSessionIndex>'
+        '<simpleTokenAuthenticationGuid>guid</simpleTokenAuthenticationGuid></simpleAuthenticationToken>')
+
+
+EXPIRED_AUTHN = _authn_token('2000/01/01 00:00:00 GMT')
+VALID_AUTHN = _authn_token('2099/01/01 00:00:00 GMT')
+VALID_AUTHZ = '<simpleAuthorizationToken><simpleTokenTTL>2099/01/01 00:00:00 GMT</simpleTokenTTL></simpleAuthorizationToken>'
+
+
+class FakeCache:
+    def __init__(self, data=None):
+        self.data = data or {}
+        self.loads = 0
+
+    def load(self, section, key, *args, **kwargs):
+        self.loads += 1
+        # Hand out copies, like reading a file would
+        return json.loads(json.dumps(self.data.get(key)))
+
+    def store(self, section, key, data, *args, **kwargs):
+        self.data[key] = json.loads(json.dumps(data))
+
+
+class FakeURLHandle:
+    def __init__(self, url):
+        self.url = url
+
+    def get_header(self, name):
+        return None
+
+
+class FakeAdobePassIE(AdobePassIE):
+    FORM = '<form action="https://login.example.com/post"></form>'
+
+    def __init__(self, downloader, authorize=None):
+        super().__init__(downloader)
+        self._authorize = authorize
+        self.requests = []
+
+    def _download_webpage_handle(self, url, video_id, *args, **kwargs):
+        path = url.rpartition('/')[2]
+        self.requests.append(path)
+        return {
+            'devices': '{"deviceId": "device"}',
+            'register': '{"client_id": "id", "client_secret": "secret"}',
+            'token': '{"access_token": "token"}',
+            'regcode': '{"code": "code"}',
+            'session': f'<session><authnToken>{html.escape(VALID_AUTHN)}</authnToken></session>',
+            'authorize': self._authorize or f'<authorize><authzToken>{html.escape(VALID_AUTHZ)}</authzToken></authorize>',
+            'shortAuthorize': 'media-token',
+        }.get(path, self.FORM), FakeURLHandle(url)
+
+
+class TestAdobePassTokens(unittest.TestCase):
+    def _make_ie(self, cache, authorize=None, **params):
+        ydl = FakeYDL(params)
+        ydl.cache = cache
+        return FakeAdobePassIE(ydl, authorize)
+
+    def _extract(self, ie):
+        return ie._extract_mvpd_auth('https://example.com/video', 'video', 'REQ', 'resource', 'statement')
+
+    def test_cached_tokens(self):
+        cache = FakeCache({'REQ': {'authn_token': VALID_AUTHN, 'resource': VALID_AUTHZ}})
+        ie = self._make_ie(cache)
+        self.assertEqual(self._extract(ie), 'media-token')
+        self.assertEqual(self._extract(ie), 'media-token')
+        self.assertEqual(ie.requests, ['shortAuthorize', 'shortAuthorize'])
+        # The cache file is only read once per extractor
+        self.assertEqual(cache.loads, 1)
+        self.assertIn('authn_token_expires', ie._mvpd_cache['REQ'])
+
+    def test_expired_authn_token(self):
+        cache = FakeCache({'REQ': {'authn_token': EXPIRED_AUTHN, 'resource': VALID_AUTHZ}})
+        ie = self._make_ie(cache, ap_mso='DTV', ap_username='user', ap_password='pass')
+        self.assertEqual(self._extract(ie), 'media-token')
+        self.assertIn('session', ie.requests)
+        self.assertNotIn('authorize', ie.requests)
+        for requestor_info in (cache.data['REQ'], ie._mvpd_cache['REQ']):
+            self.assertEqual(requestor_info['authn_token'], VALID_AUTHN)
+            self.assertNotIn('authn_token_expires', requestor_info)
+
+    def test_pending_logout(self):
+        cache = FakeCache({'REQ': {'authn_token': VALID_AUTHN}})
+        ie = self._make_ie(cache, authorize='<pendingLogout/>')
+        with self.assertRaisesRegex(ExtractorError, 'participating TV providers'):
+            self._extract(ie)
+        self.assertEqual(cache.data['REQ'], {})
+        self.assertEqual(ie._mvpd_cache['REQ'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,7 @@
 from .cookies import SUPPORTED_BROWSERS, SUPPORTED_KEYRINGS, CookieLoadError
 from .downloader.external import get_external_downloader
 from .extractor import list_extractor_classes
-from .extractor.adobepass import MSO_INFO
+from .extractor.adobepass import get_mso, mso_list
 from .networking.impersonate import ImpersonateTarget
 from .globals import IN_CLI, plugin_dirs
 from .options import parseOpts
@@ -123,7 +123,7 @@ def print_extractor_information(opts, urls):
     elif opts.ap_list_mso:
         out = 'Supported TV Providers:\n{}\n'.format(render_table(
             ['mso', 'mso name'],
-            [[mso_id, mso_info['name']] for mso_id, mso_info in MSO_INFO.items()]))
+            mso_list()))
     elif opts.list_extractors_json:
         from .extractor.generic import GenericIE
         dicts = []
@@ -250,8 +250,8 @@ def validate_minmax(min_val, max_val, min_name, max_name=None):
     validate(opts.password is None or opts.username is not None, 'account username', msg='{name} missing')
     validate(opts.ap_password is None or opts.ap_username is not None,
              'TV Provider account username', msg='{name} missing')
-    validate_in('TV Provider', opts.ap_mso, MSO_INFO,
-                'Unsupported {name} "{value}", use --ap-list-mso to get a list of supported TV Providers')
+    validate(opts.ap_mso is None or get_mso(opts.ap_mso), 'TV Provider', opts.ap_mso,
+             'Unsupported {name} "{value}", use --ap-list-mso to get a list of supported TV Providers')
 
     # Numbers
     validate_positive('autonumber start', opts.autonumber_start)
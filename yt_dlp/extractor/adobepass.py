@@ -1,1381 +1,648 @@
-import getpass
+import dataclasses
+import functools
 import json
+import os
 import re
+import sys
 import time
+import types
 import urllib.parse
-import uuid
-import xml.etree.ElementTree as etree
+import xml.sax.saxutils
 
 from .common import InfoExtractor
 from ..networking.exceptions import HTTPError
 from ..utils import (
     NO_DEFAULT,
     ExtractorError,
+    RegexNotFoundError,
     parse_qs,
     unescapeHTML,
     unified_timestamp,
     urlencode_postdata,
 )
 
-MSO_INFO = {
-    'DTV': {
-        'name': 'DIRECTV',
-        'username_field': 'username',
-        'password_field': 'password',
-    },
-    'ATT': {
-        'name': 'AT&T U-verse',
-        'username_field': 'userid',
-        'password_field': 'password',
-    },
-    'ATTOTT': {
-        'name': 'DIRECTV NOW',
-        'username_field': 'email',
-        'password_field': 'loginpassword',
-    },
-    'RCN': {
-        'name': 'RCN',
-        'username_field': 'username',
-        'password_field': 'password',
-    },
-    'Rogers': {
-        'name': 'Rogers',
-        'username_field': 'UserName',
-        'password_field': 'UserPassword',
-    },
-    'Comcast_SSO': {
-        'name': 'Comcast XFINITY',
-        'username_field': 'user',
-        'password_field': 'passwd',
-        'login_hostname': 'login.xfinity.com',
-    },
-    'TWC': {
-        'name': 'Time Warner Cable | Spectrum',
-        'username_field': 'Ecom_User_ID',
-        'password_field': 'Ecom_Password',
-    },
-    'Brighthouse': {
-        'name': 'Bright House Networks | Spectrum',
-        'username_field': 'j_username',
-        'password_field': 'j_password',
-    },
-    'Charter_Direct': {
-        'name': 'Charter Spectrum',
-        'username_field': 'IDToken1',
-        'password_field': 'IDToken2',
-    },
-    'Spectrum': {
-        'name': 'Spectrum',
-        'username_field': 'IDToken1',
-        'password_field': 'IDToken2',
-    },
-    'Philo': {
-        'name': 'Philo',
-        'username_field': 'ident',
-    },
-    'Verizon': {
-        'name': 'Verizon FiOS',
-        'username_field': 'IDToken1',
-        'password_field': 'IDToken2',
-        'login_hostname': 'ssoauth.verizon.com',
-    },
-    'Fubo': {
-        'name': 'Fubo',
-        'username_field': 'username',
-        'password_field': 'password',
-    },
-    'Cablevision': {
-        'name': 'Optimum/Cablevision',
-        'username_field': 'j_username',
-        'password_field': 'j_password',
-    },
-    'thr030': {
-        'name': '3 Rivers Communications',
-    },
-    'com140': {
-        'name': 'Access Montana',
-    },
-    'acecommunications': {
-        'name': 'AcenTek',
-    },
-    'acm010': {
-        'name': 'Acme Communications',
-    },
-    'ada020': {
-        'name': 'Adams Cable Service',
-    },
-    'alb020': {
-        'name': 'Albany Mutual Telephone',
-    },
-    'algona': {
-        'name': 'Algona Municipal Utilities',
-    },
-    'allwest': {
-        'name': 'All West Communications',
-    },
-    'all025': {
-        'name': 'Allen\'s Communications',
-    },
-    'spl010': {
-        'name': 'Alliance Communications',
-    },
-    'all070': {
-        'name': 'ALLO Communications',
-    },
-    'alpine': {
-        'name': 'Alpine Communications',
-    },
-    'hun015': {
-        'name': 'American Broadband',
-    },
-    'nwc010': {
-        'name': 'American Broadband Missouri',
-    },
-    'com130-02': {
-        'name': 'American Community Networks',
-    },
-    'com130-01': {
-        'name': 'American Warrior Networks',
-    },
-    'tom020': {
-        'name': 'Amherst Telephone/Tomorrow Valley',
-    },
-    'tvc020': {
-        'name': 'Andycable',
-    },
-    'arkwest': {
-        'name': 'Arkwest Communications',
-    },
-    'art030': {
-        'name': 'Arthur Mutual Telephone Company',
-    },
-    'arvig': {
-        'name': 'Arvig',
-    },
-    'nttcash010': {
-        'name': 'Ashland Home Net',
-    },
-    'astound': {
-        'name': 'Astound (now Wave)',
-    },
-    'dix030': {
-        'name': 'ATC Broadband',
-    },
-    'ara010': {
-        'name': 'ATC Communications',
-    },
-    'she030-02': {
-        'name': 'Ayersville Communications',
-    },
-    'baldwin': {
-        'name': 'Baldwin Lightstream',
-    },
-    'bal040': {
-        'name': 'Ballard TV',
-    },
-    'cit025': {
-        'name': 'Bardstown Cable TV',
-    },
-    'bay030': {
-        'name': 'Bay Country Communications',
-    },
-    'tel095': {
-        'name': 'Beaver Creek Cooperative Telephone',
-    },
-    'bea020': {
-        'name': 'Beaver Valley Cable',
-    },
-    'bee010': {
-        'name': 'Bee Line Cable',
-    },
-    'wir030': {
-        'name': 'Beehive Broadband',
-    },
-    'bra020': {
-        'name': 'BELD',
-    },
-    'bel020': {
-        'name': 'Bellevue Municipal Cable',
-    },
-    'vol040-01': {
-        'name': 'Ben Lomand Connect / BLTV',
-    },
-    'bev010': {
-        'name': 'BEVCOMM',
-    },
-    'big020': {
-        'name': 'Big Sandy Broadband',
-    },
-    'ble020': {
-        'name': 'Bledsoe Telephone Cooperative',
-    },
-    'bvt010': {
-        'name': 'Blue Valley Tele-Communications',
-    },
-    'bra050': {
-        'name': 'Brandenburg Telephone Co.',
-    },
-    'bte010': {
-        'name': 'Bristol Tennessee Essential Services',
-    },
-    'annearundel': {
-        'name': 'Broadstripe',
-    },
-    'btc010': {
-        'name': 'BTC Communications',
-    },
-    'btc040': {
-        'name': 'BTC Vision - Nahunta',
-    },
-    'bul010': {
-        'name': 'Bulloch Telephone Cooperative',
-    },
-    'but010': {
-        'name': 'Butler-Bremer Communications',
-    },
-    'tel160-csp': {
-        'name': 'C Spire SNAP',
-    },
-    'csicable': {
-        'name': 'Cable Services Inc.',
-    },
-    'cableamerica': {
-        'name': 'CableAmerica',
-    },
-    'cab038': {
-        'name': 'CableSouth Media 3',
-    },
-    'weh010-camtel': {
-        'name': 'Cam-Tel Company',
-    },
-    'car030': {
-        'name': 'Cameron Communications',
-    },
-    'canbytel': {
-        'name': 'Canby Telcom',
-    },
-    'crt020': {
-        'name': 'CapRock Tv',
-    },
-    'car050': {
-        'name': 'Carnegie Cable',
-    },
-    'cas': {
-        'name': 'CAS Cable',
-    },
-    'casscomm': {
-        'name': 'CASSCOMM',
-    },
-    'mid180-02': {
-        'name': 'Catalina Broadband Solutions',
-    },
-    'cccomm': {
-        'name': 'CC Communications',
-    },
-    'nttccde010': {
-        'name': 'CDE Lightband',
-    },
-    'cfunet': {
-        'name': 'Cedar Falls Utilities',
-    },
-    'dem010-01': {
-        'name': 'Celect-Bloomer Telephone Area',
-    },
-    'dem010-02': {
-        'name': 'Celect-Bruce Telephone Area',
-    },
-    'dem010-03': {
-        'name': 'Celect-Citizens Connected Area',
-    },
-    'dem010-04': {
-        'name': 'Celect-Elmwood/Spring Valley Area',
-    },
-    'dem010-06': {
-        'name': 'Celect-Mosaic Telecom',
-    },
-    'dem010-05': {
-        'name': 'Celect-West WI Telephone Area',
-    },
-    'net010-02': {
-        'name': 'Cellcom/Nsight Telservices',
-    },
-    'cen100': {
-        'name': 'CentraCom',
-    },
-    'nttccst010': {
-        'name': 'Central Scott / CSTV',
-    },
-    'cha035': {
-        'name': 'Chaparral CableVision',
-    },
-    'cha050': {
-        'name': 'Chariton Valley Communication Corporation, Inc.',
-    },
-    'cha060': {
-        'name': 'Chatmoss Cablevision',
-    },
-    'nttcche010': {
-        'name': 'Cherokee Communications',
-    },
-    'che050': {
-        'name': 'Chesapeake Bay Communications',
-    },
-    'cimtel': {
-        'name': 'Cim-Tel Cable, LLC.',
-    },
-    'cit180': {
-        'name': 'Citizens Cablevision - Floyd, VA',
-    },
-    'cit210': {
-        'name': 'Citizens Cablevision, Inc.',
-    },
-    'cit040': {
-        'name': 'Citizens Fiber',
-    },
-    'cit250': {
-        'name': 'Citizens Mutual',
-    },
-    'war040': {
-        'name': 'Citizens Telephone Corporation',
-    },
-    'wat025': {
-        'name': 'City Of Monroe',
-    },
-    'wadsworth': {
-        'name': 'CityLink',
-    },
-    'nor100': {
-        'name': 'CL Tel',
-    },
-    'cla010': {
-        'name': 'Clarence Telephone and Cedar Communications',
-    },
-    'ser060': {
-        'name': 'Clear Choice Communications',
-    },
-    'tac020': {
-        'name': 'Click! Cable TV',
-    },
-    'war020': {
-        'name': 'CLICK1.NET',
-    },
-    'cml010': {
-        'name': 'CML Telephone Cooperative Association',
-    },
-    'cns': {
-        'name': 'CNS',
-    },
-    'com160': {
-        'name': 'Co-Mo Connect',
-    },
-    'coa020': {
-        'name': 'Coast Communications',
-    },
-    'coa030': {
-        'name': 'Coaxial Cable TV',
-    },
-    'mid055': {
-        'name': 'Cobalt TV (Mid-State Community TV)',
-    },
-    'col070': {
-        'name': 'Columbia Power & Water Systems',
-    },
-    'col080': {
-        'name': 'Columbus Telephone',
-    },
-    'nor105': {
-        'name': 'Communications 1 Cablevision, Inc.',
-    },
-    'com150': {
-        'name': 'Community Cable & Broadband',
-    },
-    'com020': {
-        'name': 'Community Communications Company',
-    },
-    'coy010': {
-        'name': 'commZoom',
-    },
-    'com025': {
-        'name': 'Complete Communication Services',
-    },
-    'cat020': {
-        'name': 'Comporium',
-    },
-    'com071': {
-        'name': 'ComSouth Telesys',
-    },
-    'consolidatedcable': {
-        'name': 'Consolidated',
-    },
-    'conwaycorp': {
-        'name': 'Conway Corporation',
-    },
-    'coo050': {
-        'name': 'Coon Valley Telecommunications Inc',
-    },
-    'coo080': {
-        'name': 'Cooperative Telephone Company',
-    },
-    'cpt010': {
-        'name': 'CP-TEL',
-    },
-    'cra010': {
-        'name': 'Craw-Kan Telephone',
-    },
-    'crestview': {
-        'name': 'Crestview Cable Communications',
-    },
-    'cross': {
-        'name': 'Cross TV',
-    },
-    'cro030': {
-        'name': 'Crosslake Communications',
-    },
-    'ctc040': {
-        'name': 'CTC - Brainerd MN',
-    },
-    'phe030': {
-        'name': 'CTV-Beam - East Alabama',
-    },
-    'cun010': {
-        'name': 'Cunningham Telephone & Cable',
-    },
-    'dpc010': {
-        'name': 'D & P Communications',
-    },
-    'dak030': {
-        'name': 'Dakota Central Telecommunications',
-    },
-    'nttcdel010': {
-        'name': 'Delcambre Telephone LLC',
-    },
-    'tel160-del': {
-        'name': 'Delta Telephone Company',
-    },
-    'sal040': {
-        'name': 'DiamondNet',
-    },
-    'ind060-dc': {
-        'name': 'Direct Communications',
-    },
-    'doy010': {
-        'name': 'Doylestown Cable TV',
-    },
-    'dic010': {
-        'name': 'DRN',
-    },
-    'dtc020': {
-        'name': 'DTC',
-    },
-    'dtc010': {
-        'name': 'DTC Cable (Delhi)',
-    },
-    'dum010': {
-        'name': 'Dumont Telephone Company',
-    },
-    'dun010': {
-        'name': 'Dunkerton Telephone Cooperative',
-    },
-    'cci010': {
-        'name': 'Duo County Telecom',
-    },
-    'eagle': {
-        'name': 'Eagle Communications',
-    },
-    'weh010-east': {
-        'name': 'East Arkansas Cable TV',
-    },
-    'eatel': {
-        'name': 'EATEL Video, LLC',
-    },
-    'ell010': {
-        'name': 'ECTA',
-    },
-    'emerytelcom': {
-        'name': 'Emery Telcom Video LLC',
-    },
-    'nor200': {
-        'name': 'Empire Access',
-    },
-    'endeavor': {
-        'name': 'Endeavor Communications',
-    },
-    'sun045': {
-        'name': 'Enhanced Telecommunications Corporation',
-    },
-    'mid030': {
-        'name': 'enTouch',
-    },
-    'epb020': {
-        'name': 'EPB Smartnet',
-    },
-    'jea010': {
-        'name': 'EPlus Broadband',
-    },
-    'com065': {
-        'name': 'ETC',
-    },
-    'ete010': {
-        'name': 'Etex Communications',
-    },
-    'fbc-tele': {
-        'name': 'F&B Communications',
-    },
-    'fal010': {
-        'name': 'Falcon Broadband',
-    },
-    'fam010': {
-        'name': 'FamilyView CableVision',
-    },
-    'far020': {
-        'name': 'Farmers Mutual Telephone Company',
-    },
-    'fay010': {
-        'name': 'Fayetteville Public Utilities',
-    },
-    'sal060': {
-        'name': 'fibrant',
-    },
-    'fid010': {
-        'name': 'Fidelity Communications',
-    },
-    'for030': {
-        'name': 'FJ Communications',
-    },
-    'fli020': {
-        'name': 'Flint River Communications',
-    },
-    'far030': {
-        'name': 'FMT - Jesup',
-    },
-    'foo010': {
-        'name': 'Foothills Communications',
-    },
-    'for080': {
-        'name': 'Forsyth CableNet',
-    },
-    'fbcomm': {
-        'name': 'Frankfort Plant Board',
-    },
-    'tel160-fra': {
-        'name': 'Franklin Telephone Company',
-    },
-    'nttcftc010': {
-        'name': 'FTC',
-    },
-    'fullchannel': {
-        'name': 'Full Channel, Inc.',
-    },
-    'gar040': {
-        'name': 'Gardonville Cooperative Telephone Association',
-    },
-    'gbt010': {
-        'name': 'GBT Communications, Inc.',
-    },
-    'tec010': {
-        'name': 'Genuine Telecom',
-    },
-    'clr010': {
-        'name': 'Giant Communications',
-    },
-    'gla010': {
-        'name': 'Glasgow EPB',
-    },
-    'gle010': {
-        'name': 'Glenwood Telecommunications',
-    },
-    'gra060': {
-        'name': 'GLW Broadband Inc.',
-    },
-    'goldenwest': {
-        'name': 'Golden West Cablevision',
-    },
-    'vis030': {
-        'name': 'Grantsburg Telcom',
-    },
-    'gpcom': {
-        'name': 'Great Plains Communications',
-    },
-    'gri010': {
-        'name': 'Gridley Cable Inc',
-    },
-    'hbc010': {
-        'name': 'H&B Cable Services',
-    },
-    'hae010': {
-        'name': 'Haefele TV Inc.',
-    },
-    'htc010': {
-        'name': 'Halstad Telephone Company',
-    },
-    'har005': {
-        'name': 'Harlan Municipal Utilities',
-    },
-    'har020': {
-        'name': 'Hart Communications',
-    },
-    'ced010': {
-        'name': 'Hartelco TV',
-    },
-    'hea040': {
-        'name': 'Heart of Iowa Communications Cooperative',
-    },
-    'htc020': {
-        'name': 'Hickory Telephone Company',
-    },
-    'nttchig010': {
-        'name': 'Highland Communication Services',
-    },
-    'hig030': {
-        'name': 'Highland Media',
-    },
-    'spc010': {
-        'name': 'Hilliary Communications',
-    },
-    'hin020': {
-        'name': 'Hinton CATV Co.',
-    },
-    'hometel': {
-        'name': 'HomeTel Entertainment, Inc.',
-    },
-    'hoodcanal': {
-        'name': 'Hood Canal Communications',
-    },
-    'weh010-hope': {
-        'name': 'Hope - Prescott Cable TV',
-    },
-    'horizoncable': {
-        'name': 'Horizon Cable TV, Inc.',
-    },
-    'hor040': {
-        'name': 'Horizon Chillicothe Telephone',
-    },
-    'htc030': {
-        'name': 'HTC Communications Co. - IL',
-    },
-    'htccomm': {
-        'name': 'HTC Communications, Inc. - IA',
-    },
-    'wal005': {
-        'name': 'Huxley Communications',
-    },
-    'imon': {
-        'name': 'ImOn Communications',
-    },
-    'ind040': {
-        'name': 'Independence Telecommunications',
-    },
-    'rrc010': {
-        'name': 'Inland Networks',
-    },
-    'stc020': {
-        'name': 'Innovative Cable TV St Croix',
-    },
-    'car100': {
-        'name': 'Innovative Cable TV St Thomas-St John',
-    },
-    'icc010': {
-        'name': 'Inside Connect Cable',
-    },
-    'int100': {
-        'name': 'Integra Telecom',
-    },
-    'int050': {
-        'name': 'Interstate Telecommunications Coop',
-    },
-    'irv010': {
-        'name': 'Irvine Cable',
-    },
-    'k2c010': {
-        'name': 'K2 Communications',
-    },
-    'kal010': {
-        'name': 'Kalida Telephone Company, Inc.',
-    },
-    'kal030': {
-        'name': 'Kalona Cooperative Telephone Company',
-    },
-    'kmt010': {
-        'name': 'KMTelecom',
-    },
-    'kpu010': {
-        'name': 'KPU Telecommunications',
-    },
-    'kuh010': {
-        'name': 'Kuhn Communications, Inc.',
-    },
-    'lak130': {
-        'name': 'Lakeland Communications',
-    },
-    'lan010': {
-        'name': 'Langco',
-    },
-    'lau020': {
-        'name': 'Laurel Highland Total Communications, Inc.',
-    },
-    'leh010': {
-        'name': 'Lehigh Valley Cooperative Telephone',
-    },
-    'bra010': {
-        'name': 'Limestone Cable/Bracken Cable',
-    },
-    'loc020': {
-        'name': 'LISCO',
-    },
-    'lit020': {
-        'name': 'Litestream',
-    },
-    'tel140': {
-        'name': 'LivCom',
-    },
-    'loc010': {
-        'name': 'LocalTel Communications',
-    },
-    'weh010-longview': {
-        'name': 'Longview - Kilgore Cable TV',
-    },
-    'lon030': {
-        'name': 'Lonsdale Video Ventures, LLC',
-    },
-    'lns010': {
-        'name': 'Lost Nation-Elwood Telephone Co.',
-    },
-    'nttclpc010': {
-        'name': 'LPC Connect',
-    },
-    'lumos': {
-        'name': 'Lumos Networks',
-    },
-    'madison': {
-        'name': 'Madison Communications',
-    },
-    'mad030': {
-        'name': 'Madison County Cable Inc.',
-    },
-    'nttcmah010': {
-        'name': 'Mahaska Communication Group',
-    },
-    'mar010': {
-        'name': 'Marne & Elk Horn Telephone Company',
-    },
-    'mcc040': {
-        'name': 'McClure Telephone Co.',
-    },
-    'mctv': {
-        'name': 'MCTV',
-    },
-    'merrimac': {
-        'name': 'Merrimac Communications Ltd.',
-    },
-    'metronet': {
-        'name': 'Metronet',
-    },
-    'mhtc': {
-        'name': 'MHTC',
-    },
-    'midhudson': {
-        'name': 'Mid-Hudson Cable',
-    },
-    'midrivers': {
-        'name': 'Mid-Rivers Communications',
-    },
-    'mid045': {
-        'name': 'Midstate Communications',
-    },
-    'mil080': {
-        'name': 'Milford Communications',
-    },
-    'min030': {
-        'name': 'MINET',
-    },
-    'nttcmin010': {
-        'name': 'Minford TV',
-    },
-    'san040-02': {
-        'name': 'Mitchell Telecom',
-    },
-    'mlg010': {
-        'name': 'MLGC',
-    },
-    'mon060': {
-        'name': 'Mon-Cre TVE',
-    },
-    'mou110': {
-        'name': 'Mountain Telephone',
-    },
-    'mou050': {
-        'name': 'Mountain Village Cable',
-    },
-    'mtacomm': {
-        'name': 'MTA Communications, LLC',
-    },
-    'mtc010': {
-        'name': 'MTC Cable',
-    },
-    'med040': {
-        'name': 'MTC Technologies',
-    },
-    'man060': {
-        'name': 'MTCC',
-    },
-    'mtc030': {
-        'name': 'MTCO Communications',
-    },
-    'mul050': {
-        'name': 'Mulberry Telecommunications',
-    },
-    'mur010': {
-        'name': 'Murray Electric System',
-    },
-    'musfiber': {
-        'name': 'MUS FiberNET',
-    },
-    'mpw': {
-        'name': 'Muscatine Power & Water',
-    },
-    'nttcsli010': {
-        'name': 'myEVTV.com',
-    },
-    'nor115': {
-        'name': 'NCC',
-    },
-    'nor260': {
-        'name': 'NDTC',
-    },
-    'nctc': {
-        'name': 'Nebraska Central Telecom, Inc.',
-    },
-    'nel020': {
-        'name': 'Nelsonville TV Cable',
-    },
-    'nem010': {
-        'name': 'Nemont',
-    },
-    'new075': {
-        'name': 'New Hope Telephone Cooperative',
-    },
-    'nor240': {
-        'name': 'NICP',
-    },
-    'cic010': {
-        'name': 'NineStar Connect',
-    },
-    'nktelco': {
-        'name': 'NKTelco',
-    },
-    'nortex': {
-        'name': 'Nortex Communications',
-    },
-    'nor140': {
-        'name': 'North Central Telephone Cooperative',
-    },
-    'nor030': {
-        'name': 'Northland Communications',
-    },
-    'nor075': {
-        'name': 'Northwest Communications',
-    },
-    'nor125': {
-        'name': 'Norwood Light Broadband',
-    },
-    'net010': {
-        'name': 'Nsight Telservices',
-    },
-    'dur010': {
-        'name': 'Ntec',
-    },
-    'nts010': {
-        'name': 'NTS Communications',
-    },
-    'new045': {
-        'name': 'NU-Telecom',
-    },
-    'nulink': {
-        'name': 'NuLink',
-    },
-    'jam030': {
-        'name': 'NVC',
-    },
-    'far035': {
-        'name': 'OmniTel Communications',
-    },
-    'onesource': {
-        'name': 'OneSource Communications',
-    },
-    'cit230': {
-        'name': 'Opelika Power Services',
-    },
-    'daltonutilities': {
-        'name': 'OptiLink',
-    },
-    'mid140': {
-        'name': 'OPTURA',
-    },
-    'ote010': {
-        'name': 'OTEC Communication Company',
-    },
-    'cci020': {
-        'name': 'Packerland Broadband',
-    },
-    'pan010': {
-        'name': 'Panora Telco/Guthrie Center Communications',
-    },
-    'otter': {
-        'name': 'Park Region Telephone & Otter Tail Telcom',
-    },
-    'mid050': {
-        'name': 'Partner Communications Cooperative',
-    },
-    'fib010': {
-        'name': 'Pathway',
-    },
-    'paulbunyan': {
-        'name': 'Paul Bunyan Communications',
-    },
-    'pem020': {
-        'name': 'Pembroke Telephone Company',
-    },
-    'mck010': {
-        'name': 'Peoples Rural Telephone Cooperative',
-    },
-    'pul010': {
-        'name': 'PES Energize',
-    },
-    'phi010': {
-        'name': 'Philippi Communications System',
-    },
-    'phonoscope': {
-        'name': 'Phonoscope Cable',
-    },
-    'pin070': {
-        'name': 'Pine Belt Communications, Inc.',
-    },
-    'weh010-pine': {
-        'name': 'Pine Bluff Cable TV',
-    },
-    'pin060': {
-        'name': 'Pineland Telephone Cooperative',
-    },
-    'cam010': {
-        'name': 'Pinpoint Communications',
-    },
-    'pio060': {
-        'name': 'Pioneer Broadband',
-    },
-    'pioncomm': {
-        'name': 'Pioneer Communications',
-    },
-    'pioneer': {
-        'name': 'Pioneer DTV',
-    },
-    'pla020': {
-        'name': 'Plant TiftNet, Inc.',
-    },
-    'par010': {
-        'name': 'PLWC',
-    },
-    'pro035': {
-        'name': 'PMT',
-    },
-    'vik011': {
-        'name': 'Polar Cablevision',
-    },
-    'pottawatomie': {
-        'name': 'Pottawatomie Telephone Co.',
-    },
-    'premiercomm': {
-        'name': 'Premier Communications',
-    },
-    'psc010': {
-        'name': 'PSC',
-    },
-    'pan020': {
-        'name': 'PTCI',
-    },
-    'qco010': {
-        'name': 'QCOL',
-    },
-    'qua010': {
-        'name': 'Quality Cablevision',
-    },
-    'rad010': {
-        'name': 'Radcliffe Telephone Company',
-    },
-    'car040': {
-        'name': 'Rainbow Communications',
-    },
-    'rai030': {
-        'name': 'Rainier Connect',
-    },
-    'ral010': {
-        'name': 'Ralls Technologies',
-    },
-    'rct010': {
-        'name': 'RC Technologies',
-    },
-    'red040': {
-        'name': 'Red River Communications',
-    },
-    'ree010': {
-        'name': 'Reedsburg Utility Commission',
-    },
-    'mol010': {
-        'name': 'Reliance Connects- Oregon',
-    },
-    'res020': {
-        'name': 'Reserve Telecommunications',
-    },
-    'weh010-resort': {
-        'name': 'Resort TV Cable',
-    },
-    'rld010': {
-        'name': 'Richland Grant Telephone Cooperative, Inc.',
-    },
-    'riv030': {
-        'name': 'River Valley Telecommunications Coop',
-    },
-    'rockportcable': {
-        'name': 'Rock Port Cablevision',
-    },
-    'rsf010': {
-        'name': 'RS Fiber',
-    },
-    'rtc': {
-        'name': 'RTC Communication Corp',
-    },
-    'res040': {
-        'name': 'RTC-Reservation Telephone Coop.',
-    },
-    'rte010': {
-        'name': 'RTEC Communications',
-    },
-    'stc010': {
-        'name': 'S&T',
-    },
-    'san020': {
-        'name': 'San Bruno Cable TV',
-    },
-    'san040-01': {
-        'name': 'Santel',
-    },
-    'sav010': {
-        'name': 'SCI Broadband-Savage Communications Inc.',
-    },
-    'sco050': {
-        'name': 'Scottsboro Electric Power Board',
-    },
-    'scr010': {
-        'name': 'Scranton Telephone Company',
-    },
-    'selco': {
-        'name': 'SELCO',
-    },
-    'she010': {
-        'name': 'Shentel',
-    },
-    'she030': {
-        'name': 'Sherwood Mutual Telephone Association, Inc.',
-    },
-    'ind060-ssc': {
-        'name': 'Silver Star Communications',
-    },
-    'sjoberg': {
-        'name': 'Sjoberg\'s Inc.',
-    },
-    'sou025': {
-        'name': 'SKT',
-    },
-    'sky050': {
-        'name': 'SkyBest TV',
-    },
-    'nttcsmi010': {
-        'name': 'Smithville Communications',
-    },
-    'woo010': {
-        'name': 'Solarus',
-    },
-    'sou075': {
-        'name': 'South Central Rural Telephone Cooperative',
-    },
-    'sou065': {
-        'name': 'South Holt Cablevision, Inc.',
-    },
-    'sou035': {
-        'name': 'South Slope Cooperative Communications',
-    },
-    'spa020': {
-        'name': 'Spanish Fork Community Network',
-    },
-    'spe010': {
-        'name': 'Spencer Municipal Utilities',
-    },
-    'spi005': {
-        'name': 'Spillway Communications, Inc.',
-    },
-    'srt010': {
-        'name': 'SRT',
-    },
-    'cccsmc010': {
-        'name': 'St. Maarten Cable TV',
-    },
-    'sta025': {
-        'name': 'Star Communications',
-    },
-    'sco020': {
-        'name': 'STE',
-    },
-    'uin010': {
-        'name': 'STRATA Networks',
-    },
-    'sum010': {
-        'name': 'Sumner Cable TV',
-    },
-    'pie010': {
-        'name': 'Surry TV/PCSI TV',
-    },
-    'swa010': {
-        'name': 'Swayzee Communications',
-    },
-    'sweetwater': {
-        'name': 'Sweetwater Cable Television Co',
-    },
-    'weh010-talequah': {
-        'name': 'Tahlequah Cable TV',
-    },
-    'tct': {
-        'name': 'TCT',
-    },
-    'tel050': {
-        'name': 'Tele-Media Company',
-    },
-    'com050': {
-        'name': 'The Community Agency',
-    },
-    'thr020': {
-        'name': 'Three River',
-    },
-    'cab140': {
-        'name': 'Town & Country Technologies',
-    },
-    'tra010': {
-        'name': 'Trans-Video',
-    },
-    'tre010': {
-        'name': 'Trenton TV Cable Company',
-    },
-    'tcc': {
-        'name': 'Tri County Communications Cooperative',
-    },
-    'tri025': {
-        'name': 'TriCounty Telecom',
-    },
-    'tri110': {
-        'name': 'TrioTel Communications, Inc.',
-    },
-    'tro010': {
-        'name': 'Troy Cablevision, Inc.',
-    },
-    'tsc': {
-        'name': 'TSC',
-    },
-    'cit220': {
-        'name': 'Tullahoma Utilities Board',
-    },
-    'tvc030': {
-        'name': 'TV Cable of Rensselaer',
-    },
-    'tvc015': {
-        'name': 'TVC Cable',
-    },
-    'cab180': {
-        'name': 'TVision',
-    },
-    'twi040': {
-        'name': 'Twin Lakes',
-    },
-    'tvtinc': {
-        'name': 'Twin Valley',
-    },
-    'uis010': {
-        'name': 'Union Telephone Company',
-    },
-    'uni110': {
-        'name': 'United Communications - TN',
-    },
-    'uni120': {
-        'name': 'United Services',
-    },
-    'uss020': {
-        'name': 'US Sonet',
-    },
-    'cab060': {
-        'name': 'USA Communications',
-    },
-    'she005': {
-        'name': 'USA Communications/Shellsburg, IA',
-    },
-    'val040': {
-        'name': 'Valley TeleCom Group',
-    },
-    'val025': {
-        'name': 'Valley Telecommunications',
-    },
-    'val030': {
-        'name': 'Valparaiso Broadband',
-    },
-    'cla050': {
-        'name': 'Vast Broadband',
-    },
-    'sul015': {
-        'name': 'Venture Communications Cooperative, Inc.',
-    },
-    'ver025': {
-        'name': 'Vernon Communications Co-op',
-    },
-    'weh010-vicksburg': {
-        'name': 'Vicksburg Video',
-    },
-    'vis070': {
-        'name': 'Vision Communications',
-    },
-    'volcanotel': {
-        'name': 'Volcano Vision, Inc.',
-    },
-    'vol040-02': {
-        'name': 'VolFirst / BLTV',
-    },
-    'ver070': {
-        'name': 'VTel',
-    },
-    'nttcvtx010': {
-        'name': 'VTX1',
-    },
-    'bci010-02': {
-        'name': 'Vyve Broadband',
-    },
-    'wab020': {
-        'name': 'Wabash Mutual Telephone',
-    },
-    'waitsfield': {
-        'name': 'Waitsfield Cable',
-    },
-    'wal010': {
-        'name': 'Walnut Communications',
-    },
-    'wavebroadband': {
-        'name': 'Wave',
-    },
-    'wav030': {
-        'name': 'Waverly Communications Utility',
-    },
-    'wbi010': {
-        'name': 'WBI',
-    },
-    'web020': {
-        'name': 'Webster-Calhoun Cooperative Telephone Association',
-    },
-    'wes005': {
-        'name': 'West Alabama TV Cable',
-    },
-    'carolinata': {
-        'name': 'West Carolina Communications',
-    },
-    'wct010': {
-        'name': 'West Central Telephone Association',
-    },
-    'wes110': {
-        'name': 'West River Cooperative Telephone Company',
-    },
-    'ani030': {
-        'name': 'WesTel Systems',
-    },
-    'westianet': {
-        'name': 'Western Iowa Networks',
-    },
-    'nttcwhi010': {
-        'name': 'Whidbey Telecom',
-    },
-    'weh010-white': {
-        'name': 'White County Cable TV',
-    },
-    'wes130': {
-        'name': 'Wiatel',
-    },
-    'wik010': {
-        'name': 'Wiktel',
-    },
-    'wil070': {
-        'name': 'Wilkes Communications, Inc./RiverStreet Networks',
-    },
-    'wil015': {
-        'name': 'Wilson Communications',
-    },
-    'win010': {
-        'name': 'Windomnet/SMBS',
-    },
-    'win090': {
-        'name': 'Windstream Cable TV',
-    },
-    'wcta': {
-        'name': 'Winnebago Cooperative Telecom Association',
-    },
-    'wtc010': {
-        'name': 'WTC',
-    },
-    'wil040': {
-        'name': 'WTC Communications, Inc.',
-    },
-    'wya010': {
-        'name': 'Wyandotte Cable',
-    },
-    'hin020-02': {
-        'name': 'X-Stream Services',
-    },
-    'xit010': {
-        'name': 'XIT Communications',
-    },
-    'yel010': {
-        'name': 'Yelcot Communications',
-    },
-    'mid180-01': {
-        'name': 'yondoo',
-    },
-    'cou060': {
-        'name': 'Zito Media',
-    },
-    'slingtv': {
-        'name': 'Sling TV',
-        'username_field': 'username',
-        'password_field': 'password',
-        'login_hostname': 'identity.sling.com',
-    },
-    'Suddenlink': {
-        'name': 'Suddenlink',
-        'username_field': 'username',
-        'password_field': 'password',
-    },
-    'AlticeOne': {
-        'name': 'Optimum TV',
-        'username_field': 'j_username',
-        'password_field': 'j_password',
-    },
+# Adobe Pass multiple-system operators (TV providers), one per line:
+#   mso_id;name[;username_field;password_field[;login_hostname]]
+# Every line is enclosed in newlines so that get_mso() can find it with a substring search
+_MSO_BLOB = '''
+DTV;DIRECTV;username;password
+ATT;AT&T U-verse;userid;password
+ATTOTT;DIRECTV NOW;email;loginpassword
+RCN;RCN;username;password
+Rogers;Rogers;UserName;UserPassword
+Comcast_SSO;Comcast XFINITY;user;passwd;login.xfinity.com
+TWC;Time Warner Cable | Spectrum;Ecom_User_ID;Ecom_Password
+Brighthouse;Bright House Networks | Spectrum;j_username;j_password
+Charter_Direct;Charter Spectrum;IDToken1;IDToken2
+Spectrum;Spectrum;IDToken1;IDToken2
+Philo;Philo;ident
+Verizon;Verizon FiOS;IDToken1;IDToken2;ssoauth.verizon.com
+Fubo;Fubo;username;password
+Cablevision;Optimum/Cablevision;j_username;j_password
+thr030;3 Rivers Communications
+com140;Access Montana
+acecommunications;AcenTek
+acm010;Acme Communications
+ada020;Adams Cable Service
+alb020;Albany Mutual Telephone
+algona;Algona Municipal Utilities
+allwest;All West Communications
+all025;Allen's Communications
+spl010;Alliance Communications
+all070;ALLO Communications
+alpine;Alpine Communications
+hun015;American Broadband
+nwc010;American Broadband Missouri
+com130-02;American Community Networks
+com130-01;American Warrior Networks
+tom020;Amherst Telephone/Tomorrow Valley
+tvc020;Andycable
+arkwest;Arkwest Communications
+art030;Arthur Mutual Telephone Company
+arvig;Arvig
+nttcash010;Ashland Home Net
+astound;Astound (now Wave)
+dix030;ATC Broadband
+ara010;ATC Communications
+she030-02;Ayersville Communications
+baldwin;Baldwin Lightstream
+bal040;Ballard TV
+cit025;Bardstown Cable TV
+bay030;Bay Country Communications
+tel095;Beaver Creek Cooperative Telephone
+bea020;Beaver Valley Cable
+bee010;Bee Line Cable
+wir030;Beehive Broadband
+bra020;BELD
+bel020;Bellevue Municipal Cable
+vol040-01;Ben Lomand Connect / BLTV
+bev010;BEVCOMM
+big020;Big Sandy Broadband
+ble020;Bledsoe Telephone Cooperative
+bvt010;Blue Valley Tele-Communications
+bra050;Brandenburg Telephone Co.
+bte010;Bristol Tennessee Essential Services
+annearundel;Broadstripe
+btc010;BTC Communications
+btc040;BTC Vision - Nahunta
+bul010;Bulloch Telephone Cooperative
+but010;Butler-Bremer Communications
+tel160-csp;C Spire SNAP
+csicable;Cable Services Inc.
+cableamerica;CableAmerica
+cab038;CableSouth Media 3
+weh010-camtel;Cam-Tel Company
+car030;Cameron Communications
+canbytel;Canby Telcom
+crt020;CapRock Tv
+car050;Carnegie Cable
+cas;CAS Cable
+casscomm;CASSCOMM
+mid180-02;Catalina Broadband Solutions
+cccomm;CC Communications
+nttccde010;CDE Lightband
+cfunet;Cedar Falls Utilities
+dem010-01;Celect-Bloomer Telephone Area
+dem010-02;Celect-Bruce Telephone Area
+dem010-03;Celect-Citizens Connected Area
+dem010-04;Celect-Elmwood/Spring Valley Area
+dem010-06;Celect-Mosaic Telecom
+dem010-05;Celect-West WI Telephone Area
+net010-02;Cellcom/Nsight Telservices
+cen100;CentraCom
+nttccst010;Central Scott / CSTV
+cha035;Chaparral CableVision
+cha050;Chariton Valley Communication Corporation, Inc.
+cha060;Chatmoss Cablevision
+nttcche010;Cherokee Communications
+che050;Chesapeake Bay Communications
+cimtel;Cim-Tel Cable, LLC.
+cit180;Citizens Cablevision - Floyd, VA
+cit210;Citizens Cablevision, Inc.
+cit040;Citizens Fiber
+cit250;Citizens Mutual
+war040;Citizens Telephone Corporation
+wat025;City Of Monroe
+wadsworth;CityLink
+nor100;CL Tel
+cla010;Clarence Telephone and Cedar Communications
+ser060;Clear Choice Communications
+tac020;Click! Cable TV
+war020;CLICK1.NET
+cml010;CML Telephone Cooperative Association
+cns;CNS
+com160;Co-Mo Connect
+coa020;Coast Communications
+coa030;Coaxial Cable TV
+mid055;Cobalt TV (Mid-State Community TV)
+col070;Columbia Power & Water Systems
+col080;Columbus Telephone
+nor105;Communications 1 Cablevision, Inc.
+com150;Community Cable & Broadband
+com020;Community Communications Company
+coy010;commZoom
+com025;Complete Communication Services
+cat020;Comporium
+com071;ComSouth Telesys
+consolidatedcable;Consolidated
+conwaycorp;Conway Corporation
+coo050;Coon Valley Telecommunications Inc
+coo080;Cooperative Telephone Company
+cpt010;CP-TEL
+cra010;Craw-Kan Telephone
+crestview;Crestview Cable Communications
+cross;Cross TV
+cro030;Crosslake Communications
+ctc040;CTC - Brainerd MN
+phe030;CTV-Beam - East Alabama
+cun010;Cunningham Telephone & Cable
+dpc010;D & P Communications
+dak030;Dakota Central Telecommunications
+nttcdel010;Delcambre Telephone LLC
+tel160-del;Delta Telephone Company
+sal040;DiamondNet
+ind060-dc;Direct Communications
+doy010;Doylestown Cable TV
+dic010;DRN
+dtc020;DTC
+dtc010;DTC Cable (Delhi)
+dum010;Dumont Telephone Company
+dun010;Dunkerton Telephone Cooperative
+cci010;Duo County Telecom
+eagle;Eagle Communications
+weh010-east;East Arkansas Cable TV
+eatel;EATEL Video, LLC
+ell010;ECTA
+emerytelcom;Emery Telcom Video LLC
+nor200;Empire Access
+endeavor;Endeavor Communications
+sun045;Enhanced Telecommunications Corporation
+mid030;enTouch
+epb020;EPB Smartnet
+jea010;EPlus Broadband
+com065;ETC
+ete010;Etex Communications
+fbc-tele;F&B Communications
+fal010;Falcon Broadband
+fam010;FamilyView CableVision
+far020;Farmers Mutual Telephone Company
+fay010;Fayetteville Public Utilities
+sal060;fibrant
+fid010;Fidelity Communications
+for030;FJ Communications
+fli020;Flint River Communications
+far030;FMT - Jesup
+foo010;Foothills Communications
+for080;Forsyth CableNet
+fbcomm;Frankfort Plant Board
+tel160-fra;Franklin Telephone Company
+nttcftc010;FTC
+fullchannel;Full Channel, Inc.
+gar040;Gardonville Cooperative Telephone Association
+gbt010;GBT Communications, Inc.
+tec010;Genuine Telecom
+clr010;Giant Communications
+gla010;Glasgow EPB
+gle010;Glenwood Telecommunications
+gra060;GLW Broadband Inc.
+goldenwest;Golden West Cablevision
+vis030;Grantsburg Telcom
+gpcom;Great Plains Communications
+gri010;Gridley Cable Inc
+hbc010;H&B Cable Services
+hae010;Haefele TV Inc.
+htc010;Halstad Telephone Company
+har005;Harlan Municipal Utilities
+har020;Hart Communications
+ced010;Hartelco TV
+hea040;Heart of Iowa Communications Cooperative
+htc020;Hickory Telephone Company
+nttchig010;Highland Communication Services
+hig030;Highland Media
+spc010;Hilliary Communications
+hin020;Hinton CATV Co.
+hometel;HomeTel Entertainment, Inc.
+hoodcanal;Hood Canal Communications
+weh010-hope;Hope - Prescott Cable TV
+horizoncable;Horizon Cable TV, Inc.
+hor040;Horizon Chillicothe Telephone
+htc030;HTC Communications Co. - IL
+htccomm;HTC Communications, Inc. - IA
+wal005;Huxley Communications
+imon;ImOn Communications
+ind040;Independence Telecommunications
+rrc010;Inland Networks
+stc020;Innovative Cable TV St Croix
+car100;Innovative Cable TV St Thomas-St John
+icc010;Inside Connect Cable
+int100;Integra Telecom
+int050;Interstate Telecommunications Coop
+irv010;Irvine Cable
+k2c010;K2 Communications
+kal010;Kalida Telephone Company, Inc.
+kal030;Kalona Cooperative Telephone Company
+kmt010;KMTelecom
+kpu010;KPU Telecommunications
+kuh010;Kuhn Communications, Inc.
+lak130;Lakeland Communications
+lan010;Langco
+lau020;Laurel Highland Total Communications, Inc.
+leh010;Lehigh Valley Cooperative Telephone
+bra010;Limestone Cable/Bracken Cable
+loc020;LISCO
+lit020;Litestream
+tel140;LivCom
+loc010;LocalTel Communications
+weh010-longview;Longview - Kilgore Cable TV
+lon030;Lonsdale Video Ventures, LLC
+lns010;Lost Nation-Elwood Telephone Co.
+nttclpc010;LPC Connect
+lumos;Lumos Networks
+madison;Madison Communications
+mad030;Madison County Cable Inc.
+nttcmah010;Mahaska Communication Group
+mar010;Marne & Elk Horn Telephone Company
+mcc040;McClure Telephone Co.
+mctv;MCTV
+merrimac;Merrimac Communications Ltd.
+metronet;Metronet
+mhtc;MHTC
+midhudson;Mid-Hudson Cable
+midrivers;Mid-Rivers Communications
+mid045;Midstate Communications
+mil080;Milford Communications
+min030;MINET
+nttcmin010;Minford TV
+san040-02;Mitchell Telecom
+mlg010;MLGC
+mon060;Mon-Cre TVE
+mou110;Mountain Telephone
+mou050;Mountain Village Cable
+mtacomm;MTA Communications, LLC
+mtc010;MTC Cable
+med040;MTC Technologies
+man060;MTCC
+mtc030;MTCO Communications
+mul050;Mulberry Telecommunications
+mur010;Murray Electric System
+musfiber;MUS FiberNET
+mpw;Muscatine Power & Water
+nttcsli010;myEVTV.com
+nor115;NCC
+nor260;NDTC
+nctc;Nebraska Central Telecom, Inc.
+nel020;Nelsonville TV Cable
+nem010;Nemont
+new075;New Hope Telephone Cooperative
+nor240;NICP
+cic010;NineStar Connect
+nktelco;NKTelco
+nortex;Nortex Communications
+nor140;North Central Telephone Cooperative
+nor030;Northland Communications
+nor075;Northwest Communications
+nor125;Norwood Light Broadband
+net010;Nsight Telservices
+dur010;Ntec
+nts010;NTS Communications
+new045;NU-Telecom
+nulink;NuLink
+jam030;NVC
+far035;OmniTel Communications
+onesource;OneSource Communications
+cit230;Opelika Power Services
+daltonutilities;OptiLink
+mid140;OPTURA
+ote010;OTEC Communication Company
+cci020;Packerland Broadband
+pan010;Panora Telco/Guthrie Center Communications
+otter;Park Region Telephone & Otter Tail Telcom
+mid050;Partner Communications Cooperative
+fib010;Pathway
+paulbunyan;Paul Bunyan Communications
+pem020;Pembroke Telephone Company
+mck010;Peoples Rural Telephone Cooperative
+pul010;PES Energize
+phi010;Philippi Communications System
+phonoscope;Phonoscope Cable
+pin070;Pine Belt Communications, Inc.
+weh010-pine;Pine Bluff Cable TV
+pin060;Pineland Telephone Cooperative
+cam010;Pinpoint Communications
+pio060;Pioneer Broadband
+pioncomm;Pioneer Communications
+pioneer;Pioneer DTV
+pla020;Plant TiftNet, Inc.
+par010;PLWC
+pro035;PMT
+vik011;Polar Cablevision
+pottawatomie;Pottawatomie Telephone Co.
+premiercomm;Premier Communications
+psc010;PSC
+pan020;PTCI
+qco010;QCOL
+qua010;Quality Cablevision
+rad010;Radcliffe Telephone Company
+car040;Rainbow Communications
+rai030;Rainier Connect
+ral010;Ralls Technologies
+rct010;RC Technologies
+red040;Red River Communications
+ree010;Reedsburg Utility Commission
+mol010;Reliance Connects- Oregon
+res020;Reserve Telecommunications
+weh010-resort;Resort TV Cable
+rld010;Richland Grant Telephone Cooperative, Inc.
+riv030;River Valley Telecommunications Coop
+rockportcable;Rock Port Cablevision
+rsf010;RS Fiber
+rtc;RTC Communication Corp
+res040;RTC-Reservation Telephone Coop.
+rte010;RTEC Communications
+stc010;S&T
+san020;San Bruno Cable TV
+san040-01;Santel
+sav010;SCI Broadband-Savage Communications Inc.
+sco050;Scottsboro Electric Power Board
+scr010;Scranton Telephone Company
+selco;SELCO
+she010;Shentel
+she030;Sherwood Mutual Telephone Association, Inc.
+ind060-ssc;Silver Star Communications
+sjoberg;Sjoberg's Inc.
+sou025;SKT
+sky050;SkyBest TV
+nttcsmi010;Smithville Communications
+woo010;Solarus
+sou075;South Central Rural Telephone Cooperative
+sou065;South Holt Cablevision, Inc.
+sou035;South Slope Cooperative Communications
+spa020;Spanish Fork Community Network
+spe010;Spencer Municipal Utilities
+spi005;Spillway Communications, Inc.
+srt010;SRT
+cccsmc010;St. Maarten Cable TV
+sta025;Star Communications
+sco020;STE
+uin010;STRATA Networks
+sum010;Sumner Cable TV
+pie010;Surry TV/PCSI TV
+swa010;Swayzee Communications
+sweetwater;Sweetwater Cable Television Co
+weh010-talequah;Tahlequah Cable TV
+tct;TCT
+tel050;Tele-Media Company
+com050;The Community Agency
+thr020;Three River
+cab140;Town & Country Technologies
+tra010;Trans-Video
+tre010;Trenton TV Cable Company
+tcc;Tri County Communications Cooperative
+tri025;TriCounty Telecom
+tri110;TrioTel Communications, Inc.
+tro010;Troy Cablevision, Inc.
+tsc;TSC
+cit220;Tullahoma Utilities Board
+tvc030;TV Cable of Rensselaer
+tvc015;TVC Cable
+cab180;TVision
+twi040;Twin Lakes
+tvtinc;Twin Valley
+uis010;Union Telephone Company
+uni110;United Communications - TN
+uni120;United Services
+uss020;US Sonet
+cab060;USA Communications
+she005;USA Communications/Shellsburg, IA
+val040;Valley TeleCom Group
+val025;Valley Telecommunications
+val030;Valparaiso Broadband
+cla050;Vast Broadband
+sul015;Venture Communications Cooperative, Inc.
+ver025;Vernon Communications Co-op
+weh010-vicksburg;Vicksburg Video
+vis070;Vision Communications
+volcanotel;Volcano Vision, Inc.
+vol040-02;VolFirst / BLTV
+ver070;VTel
+nttcvtx010;VTX1
+bci010-02;Vyve Broadband
+wab020;Wabash Mutual Telephone
+waitsfield;Waitsfield Cable
+wal010;Walnut Communications
+wavebroadband;Wave
+wav030;Waverly Communications Utility
+wbi010;WBI
+web020;Webster-Calhoun Cooperative Telephone Association
+wes005;West Alabama TV Cable
+carolinata;West Carolina Communications
+wct010;West Central Telephone Association
+wes110;West River Cooperative Telephone Company
+ani030;WesTel Systems
+westianet;Western Iowa Networks
+nttcwhi010;Whidbey Telecom
+weh010-white;White County Cable TV
+wes130;Wiatel
+wik010;Wiktel
+wil070;Wilkes Communications, Inc./RiverStreet Networks
+wil015;Wilson Communications
+win010;Windomnet/SMBS
+win090;Windstream Cable TV
+wcta;Winnebago Cooperative Telecom Association
+wtc010;WTC
+wil040;WTC Communications, Inc.
+wya010;Wyandotte Cable
+hin020-02;X-Stream Services
+xit010;XIT Communications
+yel010;Yelcot Communications
+mid180-01;yondoo
+cou060;Zito Media
+slingtv;Sling TV;username;password;identity.sling.com
+Suddenlink;Suddenlink;username;password
+AlticeOne;Optimum TV;j_username;j_password
+'''
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MSOInfo:
+    name: str
+    username_field: str | None = None
+    password_field: str | None = None
+    login_hostname: str | None = None
+
+
+def _parse_mso_line(line):
+    # Field names are shared by many providers
+    return [sys.intern(v) if v else None for v in line.split(';')]
+
+
+@functools.cache
+def mso_names():
+    return types.MappingProxyType(dict(
+        _parse_mso_line(line)[:2] for line in _MSO_BLOB.strip('\n').splitlines()))
+
+
+def mso_ids():
+    return mso_names().keys()
+
+
+@functools.cache
+def mso_list():
+    """Returns a tuple of (mso_id, name), sorted by name"""
+    return tuple(sorted(mso_names().items(), key=lambda x: x[1].lower()))
+
+
+@functools.cache
+def get_mso(mso_id):
+    if ';' in mso_id:
+        return None
+    # Slice out the single entry instead of parsing the whole blob
+    start = _MSO_BLOB.find(f'\n{mso_id};')
+    if start == -1:
+        return None
+    _, *fields = _parse_mso_line(_MSO_BLOB[start + 1:_MSO_BLOB.index('\n', start + 1)])
+    return MSOInfo(*fields)
+
+
+@functools.cache
+def _mso_info_compat():
+    # Read-only snapshot in the format of the former MSO_INFO dict
+    return types.MappingProxyType({
+        mso_id: {k: v for k, v in dataclasses.asdict(get_mso(mso_id)).items() if v}
+        for mso_id in mso_ids()})
+
+
+def __getattr__(name):
+    if name == 'MSO_INFO':
+        return _mso_info_compat()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+_HTTP_URL_RE = re.compile(r'https?://')
+_FORM_ACTION_RE = re.compile(r'<form[^>]+action=(["\'])(?P<url>.+?)\1')
+# TODO: eliminate code duplication with generic extractor
+_META_REFRESH_RE = re.compile(
+    r'(?i)<meta\s+(?=(?:[a-z-]+="[^"]+"\s+)*http-equiv="refresh")'
+    r'(?:[a-z-]+="[^"]+"\s+)*?content="[0-9]{,2};\s*(?:URL|url)=\'?([^\'"]+)')
+_COMCAST_AUTO_LOGIN_RE = re.compile(r'window\.location\s*=\s*[\'"]([^\'"]+)')
+_COMCAST_SIGNED_IN_RE = re.compile(r'continue:\s*"(https://oauth\.xfinity\.com/oauth/authorize\?.+)"')
+_VERIZON_SAML_REDIRECT_RE = re.compile(r'self\.parent\.location=(["\'])(?P<url>.+?)\1')
+_ABC_SAML_REDIRECT_RE = re.compile(r'var\surl\s*=\s*(["\'])(?P<url>.+?)\1')
+_JS_ESCAPE_RE = re.compile(r'\\(/|-|x26)')
+_JS_ESCAPES = {'/': '/', '-': '-', 'x26': '&'}
+_SAML_LOGIN_URL_RE = re.compile(r'xmlHttp\.open\("POST"\s*,\s*(["\'])(?P<url>.+?)\1')
+_SPECTRUM_SAML_VARS_RE = re.compile(r'(RelayState|SAMLRequest)\s*=\s*"((?:\\.|[^"\\\n])+)";')
+_AJAX_URL_RE = re.compile(r'url:\s*[\'"]([^\'"]+)')
+_XML_FIELD_RE = re.compile(r'<(\w+)>([^<\n]+)</\1>')
+
+
+def _xml_escape(text):
+    # Same as ElementTree.tostring, which writes non-ASCII characters as character references
+    return xml.sax.saxutils.escape(text).encode('ascii', 'xmlcharrefreplace').decode()
+
+
+def _xml_element(tag, text, attrs=''):
+    # Elements without text are self-closing, as with ElementTree
+    if not text:
+        return f'<{tag}{attrs} />'
+    return f'<{tag}{attrs}>{_xml_escape(text)}</{tag}>'
+
+
+def _spectrum_saml_vars(webpage):
+    # Both variables are near the top of the login page, so stop scanning once they are found
+    saml_vars = {}
+    for mobj in _SPECTRUM_SAML_VARS_RE.finditer(webpage):
+        saml_vars.setdefault(*mobj.groups())
+        if len(saml_vars) == 2:
+            break
+    return saml_vars
+
+
+class _MVPDResource(str):
+    """Resource XML from _get_mvpd_resource that also carries the text of its guid element"""
+    guid = None
+
+
+def _xml_fields(xml_str):
+    # Only tags whose first element is text-only are collected; xml_text falls back to a regex search
+    fields = {}
+    for mobj in _XML_FIELD_RE.finditer(xml_str):
+        tag = mobj.group(1)
+        if tag not in fields and xml_str.find(f'<{tag}>') == mobj.start():
+            fields[tag] = mobj.group(2)
+    return fields
+
+
+@functools.cache
+def _xml_tag_re(tag):
+    return re.compile(f'<{tag}>(.+?)</{tag}>')
+
+
+_XML_ENTITY_RE = re.compile(r'&(?:amp|lt|gt|quot|apos|#39);')
+_XML_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&apos;': "'",
+    '&#39;': "'",
 }
 
 
+def _unescape_xml(s):
+    # Escaped tokens only contain the basic XML entities; leave anything else to unescapeHTML
+    entities = _XML_ENTITY_RE.findall(s)
+    if len(entities) != s.count('&'):
+        return unescapeHTML(s)
+    return _XML_ENTITY_RE.sub(lambda m: _XML_ENTITIES[m.group(0)], s) if entities else s
+
+
 class AdobePassIE(InfoExtractor):  # XXX: Conventionally, base classes should end with BaseIE/InfoExtractor
     _SERVICE_PROVIDER_TEMPLATE = 'https://sp.auth.adobe.com/adobe-services/%s'
     _USER_AGENT = 'Mozilla/5.0 (X11; Linux i686; rv:47.0) Gecko/20100101 Firefox/47.0'
+    _MVPD_HEADERS = types.MappingProxyType({
+        'ap_42': 'anonymous',
+        'ap_11': 'Linux i686',
+        'ap_z': _USER_AGENT,
+        'User-Agent': _USER_AGENT,
+    })
+    _JSON_HEADERS = types.MappingProxyType({'Content-Type': 'application/json; charset=UTF-8'})
+    _FORM_HEADERS = types.MappingProxyType({'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'})
     _MVPD_CACHE = 'ap-mvpd'
 
     _DOWNLOADING_LOGIN_PAGE = 'Downloading Provider Login Page'
 
+    def set_downloader(self, downloader):
+        super().set_downloader(downloader)
+        self._ap_geo_headers = None
+        self._mvpd_cache = {}
+        self._token_fields = {}
+
     def _download_webpage_handle(self, *args, **kwargs):
-        headers = self.geo_verification_headers()
-        headers.update(kwargs.get('headers') or {})
-        kwargs['headers'] = headers
+        if self._ap_geo_headers is None:
+            self._ap_geo_headers = self.geo_verification_headers()
+        headers = kwargs.get('headers')
+        kwargs['headers'] = {**self._ap_geo_headers, **headers} if headers else self._ap_geo_headers
         return super()._download_webpage_handle(
             *args, **kwargs)
 
+    def _load_mvpd_cache(self, requestor_id):
+        # Avoid re-reading the cache file for every video of a playlist
+        if requestor_id not in self._mvpd_cache:
+            self._mvpd_cache[requestor_id] = self.cache.load(self._MVPD_CACHE, requestor_id) or {}
+        return self._mvpd_cache[requestor_id]
+
+    def _store_mvpd_cache(self, requestor_id, requestor_info):
+        self._mvpd_cache[requestor_id] = requestor_info
+        self.cache.store(self._MVPD_CACHE, requestor_id, requestor_info)
+
+    def _get_token_fields(self, token):
+        # Tokens are reused for every video of a requestor, so keep their fields around
+        if token not in self._token_fields:
+            self._token_fields[token] = _xml_fields(token)
+        return self._token_fields[token]
+
     @staticmethod
     def _get_mso_headers(mso_info):
         # Not needed currently
@@ -1383,43 +650,54 @@ def _get_mso_headers(mso_info):
 
     @staticmethod
     def _get_mvpd_resource(provider_id, title, guid, rating):
-        channel = etree.Element('channel')
-        channel_title = etree.SubElement(channel, 'title')
-        channel_title.text = provider_id
-        item = etree.SubElement(channel, 'item')
-        resource_title = etree.SubElement(item, 'title')
-        resource_title.text = title
-        resource_guid = etree.SubElement(item, 'guid')
-        resource_guid.text = guid
-        resource_rating = etree.SubElement(item, 'media:rating')
-        resource_rating.attrib = {'scheme': 'urn:v-chip'}
-        resource_rating.text = rating
-        return '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">' + etree.tostring(channel).decode() + '</rss>'
+        resource = _MVPDResource(''.join((
+            '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>',
+            _xml_element('title', provider_id),
+            '<item>',
+            _xml_element('title', title),
+            _xml_element('guid', guid),
+            _xml_element('media:rating', rating, ' scheme="urn:v-chip"'),
+            '</item></channel></rss>')))
+        if guid:
+            resource.guid = _xml_escape(guid)
+        return resource
 
     def _extract_mvpd_auth(self, url, video_id, requestor_id, resource, software_statement):
         mso_id = self.get_param('ap_mso')
         if mso_id:
-            mso_info = MSO_INFO[mso_id]
+            mso_info = get_mso(mso_id)
+            if mso_info is None:
+                raise ExtractorError(f'Unsupported TV Provider "{mso_id}"', expected=True)
         else:
-            mso_info = {}
+            mso_info = MSOInfo(None)
+        mso_headers = self._get_mso_headers(mso_info)
+        now = int(time.time())
+        form_headers = {**mso_headers, 'Content-Type': 'application/x-www-form-urlencoded'}
 
-        def xml_text(xml_str, tag):
-            return self._search_regex(
-                f'<{tag}>(.+?)</{tag}>', xml_str, tag)
+        def xml_text(xml_str, tag, fields=None):
+            if fields and tag in fields:
+                return fields[tag]
+            return self._search_regex(_xml_tag_re(tag), xml_str, tag)
 
-        def is_expired(token, date_ele):
-            token_expires = unified_timestamp(re.sub(r'[_ ]GMT', '', xml_text(token, date_ele)))
-            return token_expires and token_expires <= int(time.time())
+        def is_expired(key, date_ele):
+            # The expiry timestamp is cached next to the token and dropped whenever the token is replaced
+            expires_key = f'{key}_expires'
+            if expires_key not in requestor_info:
+                token = requestor_info[key]
+                requestor_info[expires_key] = unified_timestamp(
+                    xml_text(token, date_ele, self._get_token_fields(token)).replace('_GMT', '').replace(' GMT', ''))
+            token_expires = requestor_info[expires_key]
+            return token_expires and token_expires <= now
 
         def post_form(form_page_res, note, data={}, validate_url=False):
             form_page, urlh = form_page_res
-            post_url = self._html_search_regex(r'<form[^>]+action=(["\'])(?P<url>.+?)\1', form_page, 'post url', group='url')
-            if not re.match(r'https?://', post_url):
+            post_url = self._html_search_regex(_FORM_ACTION_RE, form_page, 'post url', group='url')
+            if not _HTTP_URL_RE.match(post_url):
                 post_url = urllib.parse.urljoin(urlh.url, post_url)
             if validate_url:
                 # This request is submitting credentials so we should validate it when possible
                 url_parsed = urllib.parse.urlparse(post_url)
-                expected_hostname = mso_info.get('login_hostname')
+                expected_hostname = mso_info.login_hostname
                 if expected_hostname and expected_hostname != url_parsed.hostname:
                     raise ExtractorError(
                         f'Unexpected login URL hostname; expected "{expected_hostname}" but got '
@@ -1430,10 +708,16 @@ def post_form(form_page_res, note, data={}, validate_url=False):
             form_data = self._hidden_inputs(form_page)
             form_data.update(data)
             return self._download_webpage_handle(
-                post_url, video_id, note, data=urlencode_postdata(form_data), headers={
-                    **self._get_mso_headers(mso_info),
-                    'Content-Type': 'application/x-www-form-urlencoded',
-                })
+                post_url, video_id, note, data=urlencode_postdata(form_data), headers=form_headers)
+
+        def reset_on_pending_logout(response):
+            # Clears the cached tokens when Adobe asks us to authenticate again
+            nonlocal requestor_info
+            if '<pendingLogout' not in response:
+                return False
+            requestor_info = {}
+            self._store_mvpd_cache(requestor_id, requestor_info)
+            return True
 
         def raise_mvpd_required():
             raise ExtractorError(
@@ -1442,13 +726,9 @@ def raise_mvpd_required():
                 'and --ap-username and --ap-password or --netrc to provide account credentials.', expected=True)
 
         def extract_redirect_url(html, url=None, fatal=False):
-            # TODO: eliminate code duplication with generic extractor and move
-            # redirection code into _download_webpage_handle
-            REDIRECT_REGEX = r'[0-9]{,2};\s*(?:URL|url)=\'?([^\'"]+)'
+            # TODO: move redirection code into _download_webpage_handle
             redirect_url = self._search_regex(
-                r'(?i)<meta\s+(?=(?:[a-z-]+="[^"]+"\s+)*http-equiv="refresh")'
-                rf'(?:[a-z-]+="[^"]+"\s+)*?content="{REDIRECT_REGEX}',
-                html, 'meta refresh redirect',
+                _META_REFRESH_RE, html, 'meta refresh redirect',
                 default=NO_DEFAULT if fatal else None, fatal=fatal)
             if not redirect_url:
                 return None
@@ -1456,18 +736,15 @@ def extract_redirect_url(html, url=None, fatal=False):
                 redirect_url = urllib.parse.urljoin(url, unescapeHTML(redirect_url))
             return redirect_url
 
-        mvpd_headers = {
-            'ap_42': 'anonymous',
-            'ap_11': 'Linux i686',
-            'ap_z': self._USER_AGENT,
-            'User-Agent': self._USER_AGENT,
-        }
+        mvpd_headers = {**self._MVPD_HEADERS}
 
-        guid = xml_text(resource, 'guid') if '<' in resource else resource
+        guid = getattr(resource, 'guid', None)
+        if not guid:
+            guid = xml_text(resource, 'guid') if resource.lstrip().startswith('<') else resource
+        requestor_info = self._load_mvpd_cache(requestor_id)
         for _ in range(2):
-            requestor_info = self.cache.load(self._MVPD_CACHE, requestor_id) or {}
             authn_token = requestor_info.get('authn_token')
-            if authn_token and is_expired(authn_token, 'simpleTokenExpires'):
+            if authn_token and is_expired('authn_token', 'simpleTokenExpires'):
                 authn_token = None
             if not authn_token:
                 if not mso_id:
@@ -1475,12 +752,16 @@ def extract_redirect_url(html, url=None, fatal=False):
                 username, password = self._get_login_info('ap_username', 'ap_password', mso_id)
                 if not username or not password:
                     raise_mvpd_required()
+                login_data = {
+                    mso_info.username_field or 'username': username,
+                    mso_info.password_field or 'password': password,
+                }
 
                 device_info, urlh = self._download_json_handle(
                     'https://sp.auth.adobe.com/indiv/devices',
                     video_id, 'Registering device with Adobe',
-                    data=json.dumps({'fingerprint': uuid.uuid4().hex}).encode(),
-                    headers={'Content-Type': 'application/json; charset=UTF-8'})
+                    data=json.dumps({'fingerprint': os.urandom(16).hex()}).encode(),
+                    headers=self._JSON_HEADERS)
 
                 device_id = device_info['deviceId']
                 mvpd_headers['pass_sfp'] = urlh.get_header('pass_sfp')
@@ -1490,7 +771,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                     'https://sp.auth.adobe.com/o/client/register',
                     video_id, 'Registering client with Adobe',
                     data=json.dumps({'software_statement': software_statement}).encode(),
-                    headers={'Content-Type': 'application/json; charset=UTF-8'})
+                    headers=self._JSON_HEADERS)
 
                 access_token = self._download_json(
                     'https://sp.auth.adobe.com/o/client/token', video_id,
@@ -1499,9 +780,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                         'client_id': registration['client_id'],
                         'client_secret': registration['client_secret'],
                     }),
-                    headers={
-                        'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                    })['access_token']
+                    headers=self._FORM_HEADERS)['access_token']
                 mvpd_headers['Authorization'] = f'Bearer {access_token}'
 
                 reg_code = self._download_json(
@@ -1513,7 +792,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                         'format': 'json',
                     }),
                     headers={
-                        'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+                        **self._FORM_HEADERS,
                         'Authorization': f'Bearer {access_token}',
                     })['code']
 
@@ -1527,7 +806,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                         'domain_name': 'adobe.com',
                         'redirect_url': url,
                         'reg_code': reg_code,
-                    }, headers=self._get_mso_headers(mso_info))
+                    }, headers=mso_headers)
 
                 if mso_id == 'Comcast_SSO':
                     # Comcast page flow varies by video site and whether you
@@ -1535,14 +814,13 @@ def extract_redirect_url(html, url=None, fatal=False):
                     provider_redirect_page, urlh = provider_redirect_page_res
                     if 'automatically signing you in' in provider_redirect_page:
                         oauth_redirect_url = self._html_search_regex(
-                            r'window\.location\s*=\s*[\'"]([^\'"]+)',
-                            provider_redirect_page, 'oauth redirect')
+                            _COMCAST_AUTO_LOGIN_RE, provider_redirect_page, 'oauth redirect')
                         self._download_webpage(
                             oauth_redirect_url, video_id, 'Confirming auto login')
                     elif 'automatically signed in with' in provider_redirect_page:
                         # Seems like comcast is rolling up new way of automatically signing customers
                         oauth_redirect_url = self._html_search_regex(
-                            r'continue:\s*"(https://oauth\.xfinity\.com/oauth/authorize\?.+)"', provider_redirect_page,
+                            _COMCAST_SIGNED_IN_RE, provider_redirect_page,
                             'oauth redirect (signed)')
                         # Just need to process the request. No useful data comes back
                         self._download_webpage(oauth_redirect_url, video_id, 'Confirming auto login')
@@ -1554,17 +832,14 @@ def extract_redirect_url(html, url=None, fatal=False):
                                 provider_redirect_page, fatal=True)
                             provider_login_page_res = self._download_webpage_handle(
                                 oauth_redirect_url, video_id, self._DOWNLOADING_LOGIN_PAGE,
-                                headers=self._get_mso_headers(mso_info))
+                                headers=mso_headers)
                         else:
                             provider_login_page_res = post_form(
                                 provider_redirect_page_res,
                                 self._DOWNLOADING_LOGIN_PAGE)
 
                         mvpd_confirm_page_res = post_form(
-                            provider_login_page_res, 'Logging in', {
-                                mso_info['username_field']: username,
-                                mso_info['password_field']: password,
-                            }, validate_url=True)
+                            provider_login_page_res, 'Logging in', login_data, validate_url=True)
                         mvpd_confirm_page, urlh = mvpd_confirm_page_res
                         if '<button class="submit" value="Resume">Resume</button>' in mvpd_confirm_page:
                             post_form(mvpd_confirm_page_res, 'Confirming Login')
@@ -1577,13 +852,14 @@ def extract_redirect_url(html, url=None, fatal=False):
                             'device': 'web',
                             'send_confirm_link': False,
                             'send_token': True,
-                            'device_ident': f'web-{uuid.uuid4().hex}',
+                            'device_ident': f'web-{os.urandom(16).hex()}',
                             'include_login_link': True,
                         }).encode(), headers={
                             'Content-Type': 'application/json',
                             'Accept': 'application/json',
                         })
 
+                    import getpass
                     philo_code = getpass.getpass('Type auth code you have received [Return]: ')
                     self._request_webpage(
                         'https://idp.philo.com/auth/update/login_code', video_id,
@@ -1602,8 +878,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                     # From non-Verizon IP, still gave 'Please wait', but noticed N==Y; will need to try on Verizon IP
                     if 'Please wait ...' in provider_redirect_page and '\'N\'== "Y"' not in provider_redirect_page:
                         saml_redirect_url = self._html_search_regex(
-                            r'self\.parent\.location=(["\'])(?P<url>.+?)\1',
-                            provider_redirect_page,
+                            _VERIZON_SAML_REDIRECT_RE, provider_redirect_page,
                             'SAML Redirect URL', group='url')
                         saml_login_page = self._download_webpage(
                             saml_redirect_url, video_id,
@@ -1611,10 +886,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                     elif 'Verizon FiOS - sign in' in provider_redirect_page:
                         # FXNetworks from non-Verizon IP
                         saml_login_page_res = post_form(
-                            provider_redirect_page_res, 'Logging in', {
-                                mso_info['username_field']: username,
-                                mso_info['password_field']: password,
-                            }, validate_url=True)
+                            provider_redirect_page_res, 'Logging in', login_data, validate_url=True)
                         saml_login_page, urlh = saml_login_page_res
                         if 'Please try again.' in saml_login_page:
                             raise ExtractorError(
@@ -1622,26 +894,19 @@ def extract_redirect_url(html, url=None, fatal=False):
                     else:
                         # ABC from non-Verizon IP
                         saml_redirect_url = self._html_search_regex(
-                            r'var\surl\s*=\s*(["\'])(?P<url>.+?)\1',
-                            provider_redirect_page,
+                            _ABC_SAML_REDIRECT_RE, provider_redirect_page,
                             'SAML Redirect URL', group='url')
-                        saml_redirect_url = saml_redirect_url.replace(r'\/', '/')
-                        saml_redirect_url = saml_redirect_url.replace(r'\-', '-')
-                        saml_redirect_url = saml_redirect_url.replace(r'\x26', '&')
+                        saml_redirect_url = _JS_ESCAPE_RE.sub(lambda m: _JS_ESCAPES[m.group(1)], saml_redirect_url)
                         saml_login_page = self._download_webpage(
                             saml_redirect_url, video_id,
                             'Downloading SAML Login Page')
                         saml_login_page, urlh = post_form(
-                            [saml_login_page, saml_redirect_url], 'Logging in', {
-                                mso_info['username_field']: username,
-                                mso_info['password_field']: password,
-                            }, validate_url=True)
+                            [saml_login_page, saml_redirect_url], 'Logging in', login_data, validate_url=True)
                         if 'Please try again.' in saml_login_page:
                             raise ExtractorError(
                                 'Failed to login, incorrect User ID or Password.')
                     saml_login_url = self._search_regex(
-                        r'xmlHttp\.open\("POST"\s*,\s*(["\'])(?P<url>.+?)\1',
-                        saml_login_page, 'SAML Login URL', group='url')
+                        _SAML_LOGIN_URL_RE, saml_login_page, 'SAML Login URL', group='url')
                     saml_response_json = self._download_json(
                         saml_login_url, video_id, 'Downloading SAML Response',
                         headers={'Content-Type': 'text/xml'})
@@ -1660,17 +925,16 @@ def extract_redirect_url(html, url=None, fatal=False):
                     provider_login_page_res = post_form(
                         provider_redirect_page_res, self._DOWNLOADING_LOGIN_PAGE)
                     saml_login_page, urlh = provider_login_page_res
-                    relay_state = self._search_regex(
-                        r'RelayState\s*=\s*"(?P<relay>.+?)";',
-                        saml_login_page, 'RelayState', group='relay')
-                    saml_request = self._search_regex(
-                        r'SAMLRequest\s*=\s*"(?P<saml_request>.+?)";',
-                        saml_login_page, 'SAMLRequest', group='saml_request')
+                    saml_vars = _spectrum_saml_vars(saml_login_page)
+                    for name in ('RelayState', 'SAMLRequest'):
+                        if name not in saml_vars:
+                            name = self._downloader._format_err(name, self._downloader.Styles.EMPHASIS)
+                            raise RegexNotFoundError(f'Unable to extract {name}')
+                    relay_state = saml_vars['RelayState']
                     login_json = {
-                        mso_info['username_field']: username,
-                        mso_info['password_field']: password,
+                        **login_data,
                         'RelayState': relay_state,
-                        'SAMLRequest': saml_request,
+                        'SAMLRequest': saml_vars['SAMLRequest'],
                     }
                     saml_response_json = self._download_json(
                         'https://tveauthn.spectrum.net/tveauthentication/api/v1/manualAuth', video_id,
@@ -1703,10 +967,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                         query=hidden_data)
 
                     provider_association_redirect, urlh = post_form(
-                        provider_login_page_res, 'Logging in', {
-                            mso_info['username_field']: username,
-                            mso_info['password_field']: password,
-                        }, validate_url=True)
+                        provider_login_page_res, 'Logging in', login_data, validate_url=True)
 
                     provider_refresh_redirect_url = extract_redirect_url(
                         provider_association_redirect, url=urlh.url)
@@ -1743,7 +1004,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                         provider_login_page_res = provider_login_redirect_page_res
                     else:
                         provider_tryauth_url = self._html_search_regex(
-                            r'url:\s*[\'"]([^\'"]+)', provider_login_redirect_page, 'ajaxurl')
+                            _AJAX_URL_RE, provider_login_redirect_page, 'ajaxurl')
                         provider_tryauth_page = self._download_webpage(
                             provider_tryauth_url, video_id, 'Submitting TryAuth',
                             query=hidden_data)
@@ -1754,10 +1015,7 @@ def extract_redirect_url(html, url=None, fatal=False):
                             query=hidden_data)
 
                     provider_association_redirect, urlh = post_form(
-                        provider_login_page_res, 'Logging in', {
-                            mso_info['username_field']: username,
-                            mso_info['password_field']: password,
-                        }, validate_url=True)
+                        provider_login_page_res, 'Logging in', login_data, validate_url=True)
 
                     provider_refresh_redirect_url = extract_redirect_url(
                         provider_association_redirect, url=urlh.url)
@@ -1807,12 +1065,9 @@ def extract_redirect_url(html, url=None, fatal=False):
                             'Downloading Provider Redirect Page (meta refresh)')
                     provider_login_page_res = post_form(
                         provider_redirect_page_res, self._DOWNLOADING_LOGIN_PAGE)
-                    form_data = {
-                        mso_info.get('username_field', 'username'): username,
-                        mso_info.get('password_field', 'password'): password,
-                    }
+                    form_data = login_data
                     if mso_id in ('Cablevision', 'AlticeOne'):
-                        form_data['_eventId_proceed'] = ''
+                        form_data = {**login_data, '_eventId_proceed': ''}
                     mvpd_confirm_page_res = post_form(
                         provider_login_page_res, 'Logging in', form_data, validate_url=True)
                     if mso_id != 'Rogers':
@@ -1830,15 +1085,16 @@ def extract_redirect_url(html, url=None, fatal=False):
                     if not mso_id and isinstance(e.cause, HTTPError) and e.cause.status == 401:
                         raise_mvpd_required()
                     raise
-                if '<pendingLogout' in session:
-                    self.cache.store(self._MVPD_CACHE, requestor_id, {})
+                if reset_on_pending_logout(session):
                     continue
-                authn_token = unescapeHTML(xml_text(session, 'authnToken'))
+                authn_token = _unescape_xml(xml_text(session, 'authnToken'))
                 requestor_info['authn_token'] = authn_token
-                self.cache.store(self._MVPD_CACHE, requestor_id, requestor_info)
+                requestor_info.pop('authn_token_expires', None)
+                self._store_mvpd_cache(requestor_id, requestor_info)
 
+            authn_fields = self._get_token_fields(authn_token)
             authz_token = requestor_info.get(guid)
-            if authz_token and is_expired(authz_token, 'simpleTokenTTL'):
+            if authz_token and is_expired(guid, 'simpleTokenTTL'):
                 authz_token = None
             if not authz_token:
                 authorize = self._download_webpage(
@@ -1847,21 +1103,21 @@ def extract_redirect_url(html, url=None, fatal=False):
                         'resource_id': resource,
                         'requestor_id': requestor_id,
                         'authentication_token': authn_token,
-                        'mso_id': xml_text(authn_token, 'simpleTokenMsoID'),
+                        'mso_id': xml_text(authn_token, 'simpleTokenMsoID', authn_fields),
                         'userMeta': '1',
                     }), headers=mvpd_headers)
-                if '<pendingLogout' in authorize:
-                    self.cache.store(self._MVPD_CACHE, requestor_id, {})
+                if reset_on_pending_logout(authorize):
                     continue
                 if '<error' in authorize:
                     raise ExtractorError(xml_text(authorize, 'details'), expected=True)
-                authz_token = unescapeHTML(xml_text(authorize, 'authzToken'))
+                authz_token = _unescape_xml(xml_text(authorize, 'authzToken'))
                 requestor_info[guid] = authz_token
-                self.cache.store(self._MVPD_CACHE, requestor_id, requestor_info)
+                requestor_info.pop(f'{guid}_expires', None)
+                self._store_mvpd_cache(requestor_id, requestor_info)
 
             mvpd_headers.update({
-                'ap_19': xml_text(authn_token, 'simpleSamlNameID'),
-                'ap_23': xml_text(authn_token, 'simpleSamlSessionIndex'),
+                'ap_19': xml_text(authn_token, 'simpleSamlNameID', authn_fields),
+                'ap_23': xml_text(authn_token, 'simpleSamlSessionIndex', authn_fields),
             })
 
             short_authorize = self._download_webpage(
@@ -1869,10 +1125,9 @@ def extract_redirect_url(html, url=None, fatal=False):
                 video_id, 'Retrieving Media Token', data=urlencode_postdata({
                     'authz_token': authz_token,
                     'requestor_id': requestor_id,
-                    'session_guid': xml_text(authn_token, 'simpleTokenAuthenticationGuid'),
+                    'session_guid': xml_text(authn_token, 'simpleTokenAuthenticationGuid', authn_fields),
                     'hashed_guid': 'false',
                 }), headers=mvpd_headers)
-            if '<pendingLogout' in short_authorize:
-                self.cache.store(self._MVPD_CACHE, requestor_id, {})
+            if reset_on_pending_logout(short_authorize):
                 continue
             return short_authorize